@@ -10,9 +10,9 @@ WARNING: While the simulation is paused / not executing, Aimsun holds the GIL.
 from __future__ import annotations
 from typing import TYPE_CHECKING, Callable
 import importlib
+import orjson
 import sys
 import pathlib
-import json
 from inspect import signature
 
 from itertools import count
@@ -84,6 +84,8 @@ def _imports():
     _import_one("common.models",
                 from_list=[
                     "Command",
+                    "CommandRoot",
+                    "CommandBatchRoot",
                     "CommandType",
                     "CommandBase",
                     "IncidentCreateDto",
@@ -116,6 +118,8 @@ if TYPE_CHECKING:
     from common.logger import get_logger
     from common.models import (
         Command,
+        CommandRoot,
+        CommandBatchRoot,
         CommandType,
         CommandBase,
         IncidentCreateDto,
@@ -577,22 +581,47 @@ def _execute(cmd: Command) -> None:
 def _process_ipc(current_time: float) -> None:
     if not _SERVER:
         return
-    if not _SCHEDULE:
+    # an empty schedule is falsy, we still need it for commands scheduled in the future
+    if _SCHEDULE is None:
         return
-    for raw_cmd in _SERVER.try_recv_all():
+    for raw_batch in _SERVER.try_recv_all():
         try:
-            cmd: Command = Command.model_validate(raw_cmd)
-            if log.isEnabledFor(DEBUG):
-                log.debug("IPC‑recv %s, time=%s:\n%s",
-                          cmd.command,
-                          cmd.time,
-                          json.dumps(cmd.payload.model_dump(), indent=2))
-            if cmd.time <= current_time:
-                _execute(cmd)
-            else:
-                _SCHEDULE.push(cmd)
+            cmds = _parse_batch(raw_batch)
         except Exception as e:
             log.exception("Failed when processing message: %s", e)
+            continue
+        for cmd in cmds:
+            _accept(cmd, current_time)
+
+
+def _parse_batch(raw_batch: bytes) -> list[Command]:
+    try:
+        return CommandBatchRoot.model_validate_json(raw_batch).root
+    except ValueError:
+        pass
+    # one bad command must not take the rest of the batch down with it
+    cmds = []
+    for item in orjson.loads(raw_batch):
+        try:
+            cmds.append(CommandRoot.model_validate(item).root)
+        except ValueError as e:
+            log.error("Rejected command %s: %s", item, e)
+    return cmds
+
+
+def _accept(cmd: Command, current_time: float) -> None:
+    try:
+        if log.isEnabledFor(DEBUG):
+            log.debug("IPC‑recv %s, time=%s:\n%s",
+                      cmd.command,
+                      cmd.time,
+                      cmd.model_dump_json(indent=2))
+        if cmd.time <= current_time:
+            _execute(cmd)
+        else:
+            _SCHEDULE.push(cmd)
+    except Exception as e:
+        log.exception("Failed when processing message: %s", e)
 
 
 def _process_schedule(up_to: float) -> None:
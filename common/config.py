@@ -27,14 +27,15 @@
 
 from __future__ import annotations
 
-import json
+import orjson
 import yaml
+import hashlib
 import pathlib
 from dataclasses import dataclass, field
 from typing import Any, Dict, Final, ClassVar, List
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from common.models import ScheduleRoot
+from common.models import Command, CommandBase
 from common.logger import get_log_manager, get_logger
 from common.schedule import Schedule
 from common.constants import get_project_root
@@ -45,6 +46,15 @@ log = get_logger(__name__)
 # TODO: Separate app config and schedules?
 # config.json, schedule.yaml or json?
 
+# Built once, validating through CommandBatchRoot would also construct the root model
+# wrapper on every chunk only for us to unwrap it again
+_SCHEDULE_TA: Final = TypeAdapter(list[Command])
+
+# Validated schedule files keyed by path, holding the digest of the contents they
+# were parsed from, every simulation load re-reads the config and parsing the YAML
+# dominates the cost. An edited file replaces its entry, so only the latest version stays.
+_SCHEDULE_FILE_CACHE: Dict[str, tuple[bytes, tuple[CommandBase, ...]]] = {}
+
 
 @dataclass
 class AppConfig:
@@ -100,18 +110,39 @@ class AppConfig:
         errors: list[str] = []
         schedule: Schedule = Schedule()
 
-        def _try_insert(raw, label: str):
+        def _try_insert(raw, label: str) -> list[CommandBase] | None:
             nonlocal schedule
             nonlocal errors
             try:
-                validated = ScheduleRoot.model_validate(raw).root
+                validated = _SCHEDULE_TA.validate_python(raw)
                 schedule.extend(validated)
+                return validated
             except ValidationError as exc:
                 for err in exc.errors():
                     loc = ".".join(map(str, err["loc"]))
                     msg = f"{label}:{loc} -> {err['msg']} (input={err.get('input')!r})"
                     errors.append(msg)
+                return None
+
+        def _insert_file(path: pathlib.Path):
+            try:
+                blob = path.read_bytes()
+            except OSError as exc:
+                log.exception("Failed to read '%s': %s", path, exc)
+                errors.append(f"{path}: could not read schedule file ({exc})")
+                return
+            key = str(path)
+            digest = hashlib.blake2b(blob, digest_size=16).digest()
+            cached = _SCHEDULE_FILE_CACHE.get(key)
+            if cached is not None and cached[0] == digest:
+                log.debug("Schedule file unchanged, reusing %d entries", len(cached[1]))
+                schedule.extend(cached[1])
                 return
+            validated = _try_insert(_load_by_extension(path, blob), key)
+            if validated is not None:
+                _SCHEDULE_FILE_CACHE[key] = (digest, tuple(validated))
+            else:
+                _SCHEDULE_FILE_CACHE.pop(key, None)
 
         for chunk in cls._iter_schedule_chunks(cfg):
             if isinstance(chunk, tuple) and chunk[0] == "@file":
@@ -119,7 +150,7 @@ class AppConfig:
                 if not path.is_absolute():
                     path = cfg_dir / path
                 log.info("Loading schedule file: %s", path)
-                _try_insert(_load_by_extension(path), str(path))
+                _insert_file(path)
             else:
                 _try_insert(chunk, "inline.schedule")
 
@@ -160,20 +191,26 @@ class AppConfig:
                          python_location=py_location,
                          schedule=schedule)
 
+    @classmethod
+    def from_json_bytes(cls, blob: bytes | str) -> AppConfig:
+        """Build the configuration from an in-memory JSON document, raises ``ValueError`` if it's malformed"""
+        return cls.from_dict(orjson.loads(blob))
+
 
-def _load_json(path: pathlib.Path) -> Dict[str, Any]:
-    """Load JSON configuration from disk."""
+def _load_json(path: pathlib.Path, blob: bytes | None = None) -> Dict[str, Any]:
+    """Load JSON configuration from disk, or from *blob* if already read."""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes() if blob is None else blob)
     except Exception as exc:
         log.exception("Failed to read config file '%s': %s", path, exc)
         return {}
 
 
-def _load_yaml(path: pathlib.Path) -> Dict[str, Any]:
-    """Load YAML file from disk"""
+def _load_yaml(path: pathlib.Path, blob: bytes | None = None) -> Dict[str, Any]:
+    """Load YAML file from disk, or from *blob* if already read"""
     try:
+        if blob is not None:
+            return yaml.safe_load(blob) or {}
         with path.open("r", encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
     except Exception as exc:
@@ -181,11 +218,11 @@ def _load_yaml(path: pathlib.Path) -> Dict[str, Any]:
         return {}
 
 
-def _load_by_extension(path: pathlib.Path) -> Dict[str, Any]:
+def _load_by_extension(path: pathlib.Path, blob: bytes | None = None) -> Dict[str, Any]:
     try:
         if path.suffix.lower() in {".yml", ".yaml"}:
-            return _load_yaml(path)
-        return _load_json(path)
+            return _load_yaml(path, blob)
+        return _load_json(path, blob)
     except Exception as exc:
         log.exception("Failed to read '%s': %s", path, exc)
         return {}
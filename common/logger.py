@@ -1,7 +1,8 @@
 import logging
+import queue
 import sys
 import pathlib
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Final, TextIO
 from common.constants import get_project_root
 
@@ -24,6 +25,32 @@ class LogLevelFormatter(logging.Formatter):
         return f"{colour}{base}{RESET}"
 
 
+class _RoutedQueueHandler(QueueHandler):
+    """Tags records with the managed logger they were emitted through, so the single
+    shared listener knows whose handlers to pass them to."""
+
+    def __init__(self, records: queue.SimpleQueue, route: str):
+        super().__init__(records)
+        self.route = route
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.tcon_route = self.route
+        return record
+
+
+class _RouteDispatcher(logging.Handler):
+    def __init__(self, routes: dict[str, list[logging.Handler]]):
+        super().__init__()
+        self.routes = routes
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.routes.get(getattr(record, "tcon_route", record.name), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
 class LogManager:
     def __init__(self,
                  default_level: str = "INFO",
@@ -34,6 +61,10 @@ class LogManager:
         self.default_ansi = default_ansi
         self.component_config: dict[str, dict] = {}
         self._cache: dict[str, logging.Logger] = {}
+        # the actual console / file handlers of every managed logger
+        self._handlers: dict[str, list[logging.Handler]] = {}
+        self._records: queue.SimpleQueue | None = None
+        self._listener: QueueListener | None = None
 
     def configure_component(self,
                             name: str,
@@ -68,13 +99,12 @@ class LogManager:
                       logger: logging.Logger,
                       cfg: dict) -> None:
         logger.setLevel(cfg["level"])
-        logger.handlers.clear()
         logger.propagate = False
 
         fmt_cls = LogLevelFormatter if cfg["ansi"] else logging.Formatter
         sh = logging.StreamHandler(sys.stdout)
         sh.setFormatter(fmt_cls(FMT, DATEFMT))
-        logger.addHandler(sh)
+        handlers: list[logging.Handler] = [sh]
 
         logfile = cfg.get("logfile", None)
         if logfile:
@@ -85,7 +115,45 @@ class LogManager:
                 backupCount=3,
                 encoding="utf-8")
             file_handler.setFormatter(logging.Formatter(FMT, DATEFMT))
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        self._handlers[logger.name] = handlers
+        self._attach(logger)
+
+    def _attach(self, logger: logging.Logger) -> None:
+        logger.handlers.clear()
+        if self._records is not None:
+            logger.addHandler(_RoutedQueueHandler(self._records, logger.name))
+        else:
+            for handler in self._handlers.get(logger.name, ()):
+                logger.addHandler(handler)
+
+    def start_listener(self) -> None:
+        """
+        Move the console / file writes of every managed logger onto one background
+        thread, logging callers (e.g. request handlers) then only enqueue the record.
+        Meant for the API process only, the simulation process keeps writing directly
+        (the embedded interpreter would hold the records back, and lose them on a crash).
+        Whoever starts the listener stops it with ``stop_listener``.
+        """
+        if self._listener is not None:
+            return
+        self._records = queue.SimpleQueue()
+        self._listener = QueueListener(self._records, _RouteDispatcher(self._handlers))
+        self._listener.start()
+        for logger in self._cache.values():
+            self._attach(logger)
+
+    def stop_listener(self) -> None:
+        """Flush whatever is still queued and go back to direct handlers"""
+        if self._listener is None:
+            return
+        listener, self._listener = self._listener, None
+        # loggers write directly again before the queue is drained and dropped
+        self._records = None
+        for logger in self._cache.values():
+            self._attach(logger)
+        listener.stop()
 
     def get_logger(self,
                    name: str) -> logging.Logger:
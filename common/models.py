@@ -1,12 +1,13 @@
 from __future__ import annotations
 from enum import Enum
 
-from typing import (Annotated, Literal, Union,  ClassVar)
+from typing import (Annotated, Any, Literal, Union,  ClassVar)
 from math import isclose
 
 from pydantic import (
     RootModel,
     BaseModel,
+    ConfigDict,
     Field,
     field_validator,
     model_validator)
@@ -52,6 +53,8 @@ class MeasureType(str, Enum):
 
 # > Incidents -----------------------------------------------------------------
 class VehicleVisibility(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     veh_type: int = Field(...,
                           description="Identifier of the vehicle type")
     distance: int = Field(...,
@@ -60,6 +63,8 @@ class VehicleVisibility(BaseModel):
 
 class IncidentCreateDto(BaseModel):
     """Incident to be generated"""
+    model_config = ConfigDict(frozen=True)
+
     section_id: int = Field(...,
                             description="Identifier of the section of the incident")
     lane: int = Field(...,
@@ -101,6 +106,8 @@ class IncidentCreateDto(BaseModel):
 
 
 class IncidentRemoveDto(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     section_id: int = Field(...,
                             description="Identifier of the section where the incident to remove is located")
     lane: int = Field(...,
@@ -110,6 +117,8 @@ class IncidentRemoveDto(BaseModel):
 
 
 class IncidentsClearSectionDto(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     section_id: int = Field(...,
                             description="Identifier of the section to clear of incidents")
 # < Incidents -----------------------------------------------------------------
@@ -117,6 +126,8 @@ class IncidentsClearSectionDto(BaseModel):
 
 # > Measures --------------------------------------------------------------------
 class _MeasureBase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id_action: int | None = Field(default=None,
                                   description="Preallocate the ID only if you know what you're doing, otherwise omit this field")
     duration: float | None = Field(default=None,
@@ -273,6 +284,8 @@ class MeasureTurnForceResult(_MeasureTurnForceBase):
 
 class NewDestinations(BaseModel):
     """Helper class for `MeasureType.DESTINATION_CHANGE`"""
+    model_config = ConfigDict(frozen=True)
+
     dest_id: int = Field(...,
                          description="Candidate destination centroid identifier")
     percentage: float = Field(default=1.0,
@@ -312,15 +325,27 @@ class MeasureDestinationChange(_MeasureBase):
                               le=1.0,
                               description="Share of drivers obeying the measure <0-1>")
 
-    @model_validator(mode="after")
-    def _fill_and_check(self):
-        # Legacy field handling:
-        if self.new_destinations is None:
-            if self.new_destination is None:
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_legacy(cls, data: Any) -> Any:
+        # Legacy field handling, done before validation so frozen subclasses
+        # (the API inputs) can share it
+        if isinstance(data, dict) and data.get("new_destinations") is None:
+            if data.get("new_destination") is None:
                 raise ValueError("Either dest_proportions or new_destination must be provided")
-            self.new_destinations = [NewDestinations(dest_id=self.new_destination, percentage=100.0)]
+            data = {**data,
+                    "new_destinations": [{"dest_id": data["new_destination"], "percentage": 100.0}]}
+        return data
 
-        total = sum(p.percentage for p in self.new_destinations)
+    @model_validator(mode="after")
+    def _check(self):
+        destinations = self.new_destinations
+        # single destination (incl. the legacy field) is by far the common case
+        if len(destinations) == 1 and isclose(destinations[0].percentage, 100.0, abs_tol=1e-6):
+            return self
+        total = 0.0
+        for p in destinations:
+            total += p.percentage
         if not isclose(total, 100.0, rel_tol=1e-9, abs_tol=1e-6):
             raise ValueError(f"Destination percentages must sum to 100.0 (got {total})")
 
@@ -349,6 +374,8 @@ class MeasureCreateDto(RootModel[MeasurePayload]):
 
 
 class MeasureRemoveDto(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id_action: int = Field(...,
                            description="ID of the measure to remove",
                            gt=0)
@@ -358,6 +385,8 @@ class MeasureRemoveDto(BaseModel):
 
 # > Policies --------------------------------------------------------------------
 class PolicyTargetDto(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     policy_id: int = Field(...,
                            description="ID of the policy to affect",
                            gt=0)
@@ -366,6 +395,8 @@ class PolicyTargetDto(BaseModel):
 
 # > Command Wrappers ------------------------------------------------------------
 class CommandBase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     IMMEDIATE: ClassVar[float] = -1
 
     command: CommandType
@@ -460,6 +491,10 @@ Command = Annotated[
 # < Command Wrappers ------------------------------------------------------------
 
 
-class ScheduleRoot(RootModel[list[Command]]):
+class CommandRoot(RootModel[Command]):
+    pass
+
+
+class CommandBatchRoot(RootModel[list[Command]]):
     pass
 # < Scheduled command ----------------------------------------------------------
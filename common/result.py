@@ -6,6 +6,9 @@ T = TypeVar("T")
 
 
 class Result(Generic[T]):
+    # One of these is created for every executed command
+    __slots__ = ("status", "value", "raw_code", "message")
+
     def __init__(
         self,
         status: AimsunStatus,
@@ -1,207 +1,440 @@
 from __future__ import annotations
 import multiprocessing as mp
-from fastapi import FastAPI,  Path, Query
-from typing import Any
+from multiprocessing.connection import Connection
+from fastapi import APIRouter, FastAPI, Path, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import Annotated, Any, Generic, TypeVar
 from logging import DEBUG, Logger
 
-import json
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 
 # FIXME: We could definitely solve the mapping
 # between a flattened input model for API and our
 # internal command representation more elegantly.
 from common.models import (
-    Command,
     CommandBase,
-    IncidentCreateCmd,
-    IncidentRemoveCmd,
-    IncidentsResetCmd,
-    IncidentsClearSectionCmd,
-    IncidentsClearSectionDto,
-    MeasurePayload,
-    MeasureCreateCmd,
-    MeasureSpeedSection,
-    MeasureSpeedDetailed,
-    MeasureLaneClosure,
-    MeasureLaneClosureDetailed,
-    MeasureLaneDeactivateReserved,
-    MeasureTurnClose,
-    MeasureTurnForceOD,
-    MeasureTurnForceResult,
-    MeasureDestinationChange,
-    MeasureRemoveDto,
-    MeasureRemoveCmd,
-    MeasuresClearCmd,
-    PolicyActivateCmd,
-    PolicyDeactivateCmd,
-    PolicyTargetDto
+    CommandType
 )
 
 from server.models import (
     ScheduledBase,
     IncidentCreateInput,
+    IncidentCreateInputTA,
     IncidentRemoveInput,
-    _MeasureBaseInput,
+    IncidentRemoveInputTA,
     MeasureSpeedSectionInput,
+    MeasureSpeedSectionInputTA,
     MeasureSpeedDetailedInput,
+    MeasureSpeedDetailedInputTA,
     MeasureLaneClosureInput,
+    MeasureLaneClosureInputTA,
     MeasureLaneClosureDetailedInput,
+    MeasureLaneClosureDetailedInputTA,
     MeasureLaneDeactivateReservedInput,
+    MeasureLaneDeactivateReservedInputTA,
     MeasureTurnCloseInput,
+    MeasureTurnCloseInputTA,
     MeasureTurnForceInputOd,
+    MeasureTurnForceInputOdTA,
     MeasureTurnForceInputResult,
-    MeasureDestinationChangeInput)
+    MeasureTurnForceInputResultTA,
+    MeasureDestinationChangeInput,
+    MeasureDestinationChangeInputTA)
 
 from common.logger import get_log_manager, get_logger
 from http import HTTPStatus
 
 
 log: Logger = get_logger(__name__)
+T = TypeVar("T")
+
+PositiveId = Annotated[int, Path(gt=0)]
+# FastAPI does not allow a default inside Annotated, it goes on the parameter.
+# orjson writes nan/inf as null, which the simulation would then reject after
+# we already answered 202, so they are refused here.
+TimeArg = Annotated[float, Query(allow_inf_nan=False)]
+
+# Every accepted command gets the exact same answer, so there is no point in
+# running it through the encoder on each request. Only the body is shared, each
+# request still gets its own Response (and with it its own mutable headers).
+_ACCEPTED_BODY = b'{"accepted":true}'
+
+
+# The envelope is fixed up to the time field, so only encode it once per command type
+_PREFIXES: dict[CommandType, bytes] = {
+    command: orjson.dumps({"command": command})[:-1] + b',"time":'
+    for command in CommandType
+}
+
+
+def _id_template(command: CommandType, field: str) -> bytes:
+    """Whole frame for commands carrying a single id, filled in with ``% (time, id)``"""
+    return _PREFIXES[command] + b'%b,"payload":{"' + field.encode() + b'":%d}}'
+
+
+# URL-only endpoints, nothing but the time and the id differs between requests
+_INCIDENTS_CLEAR_SECTION_TMPL = _id_template(CommandType.INCIDENTS_CLEAR_SECTION, "section_id")
+_MEASURE_REMOVE_TMPL = _id_template(CommandType.MEASURE_REMOVE, "id_action")
+_POLICY_ACTIVATE_TMPL = _id_template(CommandType.POLICY_ACTIVATE, "policy_id")
+_POLICY_DEACTIVATE_TMPL = _id_template(CommandType.POLICY_DEACTIVATE, "policy_id")
 
 
 # > Helpers ---------------------------------------------------------------------
-def _enqueue(queue: mp.Queue,
-             cmd: Command) -> dict[str, Any]:
-    payload = cmd.model_dump()
-    if log.isEnabledFor(DEBUG):
-        log.debug("Accepted command: \n%s", json.dumps(payload, indent=2))
-    queue.put(payload)
-    return {"accepted": True}
-
-
-def _as_command(data: ScheduledBase, command_cls: type[CommandBase]) -> Command:
-    payload = data.model_dump()
-    if log.isEnabledFor(DEBUG):
-        log.debug("Creating command from payload: %s", json.dumps(payload, indent=2))
-    return command_cls(
-        time=payload.pop("time", CommandBase.IMMEDIATE),
-        payload=payload)
-
-
-def _as_measure_create_cmd(data: _MeasureBaseInput,
-                           payload_cls: type[MeasurePayload]) -> Command:
-    payload = data.model_dump()
-    if log.isEnabledFor(DEBUG):
-        log.debug("Transforming measure to command: %s", json.dumps(payload, indent=2))
-    time = payload.pop("time", CommandBase.IMMEDIATE)
-    return MeasureCreateCmd(time=time,
-                            payload=payload_cls.model_validate(payload))
+class _CommandWriter:
+    """
+    Owns the writing end of the IPC pipe, endpoints only hand frames over to it.
+    Frames are sent in batches, each message on the pipe is a JSON array of commands.
+
+    The pipe blocks once its buffer fills up (e.g. while the simulation is paused),
+    so the actual writes happen in a single background task and never hold up
+    request handling. Debug logging of the commands happens there as well, so it
+    costs the requests nothing.
+    """
+
+    def __init__(self, conn: Connection | None, debug: bool = False):
+        self.conn = conn
+        self.debug = debug
+        self._queue: asyncio.Queue[bytes | None] | None = None
+        self._task: asyncio.Task | None = None
+        # writes are sequential anyway, a single dedicated thread keeps them off
+        # the loop without competing for the default executor
+        self._executor: ThreadPoolExecutor | None = None
+
+    def put(self, frame: bytes) -> None:
+        self._queue.put_nowait(frame)
+
+    async def start(self) -> None:
+        # created here so the queue belongs to the loop the server runs on
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tcon-ipc-writer")
+        self._task = asyncio.create_task(self._run(), name="tcon-ipc-writer")
+
+    async def stop(self) -> None:
+        self._queue.put_nowait(None)
+        await self._task
+        self._executor.shutdown()
+
+    async def join(self) -> None:
+        """Wait until every frame put so far has been written"""
+        await self._queue.join()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        running = True
+        while running:
+            # whatever piled up while the previous write was in flight goes out
+            # together as a single JSON array
+            frames = [await queue.get()]
+            while not queue.empty():
+                frames.append(queue.get_nowait())
+            taken = len(frames)
+            if None in frames:
+                running = False
+                frames = frames[:frames.index(None)]
+            try:
+                if frames:
+                    batch = b"[" + b",".join(frames) + b"]"
+                    await loop.run_in_executor(self._executor, self._send, batch)
+            except Exception as exc:
+                log.exception("Failed forwarding commands to simulation: %s", exc)
+            finally:
+                for _ in range(taken):
+                    queue.task_done()
+
+    def _send(self, batch: bytes) -> None:
+        if self.debug:
+            log.debug("Forwarding commands: %s", batch.decode())
+        self.conn.send_bytes(batch)
+
+
+def _is_json(content_type: str | None) -> bool:
+    """Missing, ``application/json`` or ``application/*+json``, as FastAPI accepts them"""
+    if not content_type:
+        return True
+    maintype, _, subtype = content_type.split(";", 1)[0].strip().lower().partition("/")
+    return maintype == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+class _JsonBody(Generic[T]):
+    """
+    Request body validated straight from the raw bytes by its prebuilt TypeAdapter,
+    parsing and validation happen in a single pydantic-core call instead of
+    FastAPI's json.loads followed by its dependency machinery.
+
+    Endpoints using it only take the bare ``Request``, which hides the body from
+    the generated docs, ``openapi`` (plus ``schemas()`` for the app) puts it back.
+    """
+    _REF = "#/components/schemas/{model}"
+    _bodies: list[_JsonBody] = []
+    _schemas: dict[str, dict[str, Any]] | None = None
+
+    def __init__(self, model: type[BaseModel], adapter: TypeAdapter[T]):
+        self.adapter = adapter
+        # the same name pydantic gives the model's schema (its title)
+        self.name = model.model_config.get("title") or model.__name__
+        self._bodies.append(self)
+        self.openapi = {
+            "requestBody": {
+                "required": True,
+                "content": {"application/json": {
+                    "schema": {"$ref": self._REF.format(model=self.name)}}}
+            },
+            "responses": {"422": {
+                "description": "Validation Error",
+                "content": {"application/json": {
+                    "schema": {"$ref": self._REF.format(model="HTTPValidationError")}}}
+            }}
+        }
+
+    @classmethod
+    def schemas(cls) -> dict[str, dict[str, Any]]:
+        """
+        Component schemas of every body, only ``/openapi.json`` needs them, so they
+        are generated on first use instead of on import (the simulation process
+        imports this module too).
+        """
+        if cls._schemas is None:
+            schemas: dict[str, dict[str, Any]] = {}
+            for body in cls._bodies:
+                schema = body.adapter.json_schema(ref_template=cls._REF)
+                schemas.update(schema.pop("$defs", {}))
+                schemas[body.name] = schema
+            cls._schemas = schemas
+        return cls._schemas
+
+    async def parse(self, request: Request) -> T:
+        content_type = request.headers.get("content-type")
+        if not _is_json(content_type):
+            # FastAPI only parses JSON bodies either, anything else fails validation.
+            # Refusing it also keeps browsers' preflight-free text/plain cross-origin
+            # POSTs from scheduling commands.
+            raise RequestValidationError([{
+                "type": "content_type",
+                "loc": ("body",),
+                "msg": "Content-Type must be application/json",
+                "input": content_type,
+            }])
+        body = await request.body()
+        try:
+            return self.adapter.validate_json(body)
+        except ValidationError as exc:
+            # same shape FastAPI reports for the bodies it validates itself
+            errors = [{**err, "loc": ("body", *err["loc"])}
+                      for err in exc.errors(include_url=False)]
+            raise RequestValidationError(errors, body=body) from None
+
+
+_INCIDENT_CREATE = _JsonBody(IncidentCreateInput, IncidentCreateInputTA)
+_INCIDENT_REMOVE = _JsonBody(IncidentRemoveInput, IncidentRemoveInputTA)
+
+# path, request body (the measure payload plus scheduling time)
+_MEASURE_ROUTES: tuple[tuple[str, _JsonBody], ...] = (
+    ("/measure/speed", _JsonBody(MeasureSpeedSectionInput, MeasureSpeedSectionInputTA)),
+    ("/measure/speed-detailed", _JsonBody(MeasureSpeedDetailedInput, MeasureSpeedDetailedInputTA)),
+    ("/measure/lane-closure", _JsonBody(MeasureLaneClosureInput, MeasureLaneClosureInputTA)),
+    ("/measure/lane-closure-detailed", _JsonBody(MeasureLaneClosureDetailedInput, MeasureLaneClosureDetailedInputTA)),
+    ("/measure/lane-unreserve", _JsonBody(MeasureLaneDeactivateReservedInput, MeasureLaneDeactivateReservedInputTA)),
+    ("/measure/turn-close", _JsonBody(MeasureTurnCloseInput, MeasureTurnCloseInputTA)),
+    ("/measure/turn-force/od", _JsonBody(MeasureTurnForceInputOd, MeasureTurnForceInputOdTA)),
+    ("/measure/turn-force/result", _JsonBody(MeasureTurnForceInputResult, MeasureTurnForceInputResultTA)),
+    ("/measure/destination-change", _JsonBody(MeasureDestinationChangeInput, MeasureDestinationChangeInputTA)),
+)
+
+
+async def _validation_error(request: Request, exc: RequestValidationError) -> Response:
+    """
+    Same response FastAPI's default handler gives, but rendered by orjson. The
+    default goes through Starlette's JSONResponse, which refuses non-finite floats,
+    so rejecting e.g. ``"time": NaN`` would end in a 500 (orjson writes null).
+    """
+    return ORJSONResponse(status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                          content={"detail": jsonable_encoder(exc.errors())})
+
+
+# Commands only ever leave this process as JSON frames for the IPC pipe, so we
+# build that representation directly instead of going through the *Cmd models
+# (which the simulation side validates on receipt anyway).
+def _enqueue(request: Request,
+             frame: bytes) -> Response:
+    request.app.state.writer.put(frame)
+    return Response(content=_ACCEPTED_BODY,
+                    media_type="application/json",
+                    status_code=HTTPStatus.ACCEPTED)
+
+
+# Fields marked ``exclude=True`` (e.g. the legacy ``new_destination``) stay off the
+# wire like they did with model_dump(), looked up once per model class
+_EXCLUDED: dict[type[BaseModel], frozenset[str]] = {}
+
+
+def _excluded(cls: type[BaseModel]) -> frozenset[str]:
+    excluded = _EXCLUDED.get(cls)
+    if excluded is None:
+        excluded = _EXCLUDED[cls] = frozenset(
+            name for name, info in cls.model_fields.items() if info.exclude)
+    return excluded
+
+
+def _model_fields(obj: BaseModel) -> dict[str, Any]:
+    excluded = _excluded(type(obj))
+    if not excluded:
+        return dict(obj.__dict__)
+    return {k: v for k, v in obj.__dict__.items() if k not in excluded}
+
+
+def _fields(obj: Any) -> dict[str, Any]:
+    """orjson fallback for nested models, their values are already validated"""
+    if isinstance(obj, BaseModel):
+        return _model_fields(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _command(command: CommandType,
+             time: float | None,
+             payload: dict[str, Any] | None = None) -> bytes:
+    """Encode the envelope ``Command`` expects on the simulation side"""
+    return b"".join((_PREFIXES[command],
+                     orjson.dumps(CommandBase.IMMEDIATE if time is None else time),
+                     b',"payload":',
+                     orjson.dumps(payload, default=_fields),
+                     b"}"))
+
+
+# The inputs have been validated by the time we get here, copying
+# their __dict__ (minus excluded fields) is all we need instead of a recursive model_dump()
+def _as_command(data: ScheduledBase, command: CommandType) -> bytes:
+    payload = _model_fields(data)
+    return _command(command, payload.pop("time", None), payload)
 # < Helpers ---------------------------------------------------------------------
 
 
 # > FastAPI --------------------------------------------------------------------
-def build_app(queue: mp.Queue) -> FastAPI:
-    app = FastAPI(title="tcon API", version="1.0.0")
-    register_incidents(app, queue)
-    register_measures(app, queue)
-    register_policies(app, queue)
+# Handlers live at module level and reach the app's IPC writer through the
+# request, so building an app only has to include the router.
+router = APIRouter()
+
+
+@router.post("/incident", status_code=HTTPStatus.ACCEPTED,
+             openapi_extra=_INCIDENT_CREATE.openapi)
+async def _incident_create(request: Request):
+    data = await _INCIDENT_CREATE.parse(request)
+    return _enqueue(request,
+                    _as_command(data, CommandType.INCIDENT_CREATE))
+
+
+@router.delete("/incident", status_code=HTTPStatus.ACCEPTED,
+               openapi_extra=_INCIDENT_REMOVE.openapi)
+async def _incident_remove(request: Request):
+    data = await _INCIDENT_REMOVE.parse(request)
+    return _enqueue(request,
+                    _as_command(data, CommandType.INCIDENT_REMOVE))
+
+
+@router.delete("/incidents/section/{section_id}", status_code=HTTPStatus.ACCEPTED)
+async def _incidents_clear_section(request: Request,
+                                   section_id: PositiveId,
+                                   time: TimeArg = CommandBase.IMMEDIATE):
+    return _enqueue(request,
+                    _INCIDENTS_CLEAR_SECTION_TMPL % (orjson.dumps(time), section_id))
+
+
+@router.post("/incidents/reset", status_code=HTTPStatus.ACCEPTED)
+async def _incidents_clear_all(request: Request,
+                               time: TimeArg = CommandBase.IMMEDIATE):
+    return _enqueue(request, _command(CommandType.INCIDENTS_RESET, time))
+
+
+def _measure_create_handler(body: _JsonBody):
+    async def handler(request: Request):
+        data = await body.parse(request)
+        return _enqueue(request,
+                        _as_command(data, CommandType.MEASURE_CREATE))
+    return handler
+
+
+for _path, _body in _MEASURE_ROUTES:
+    router.add_api_route(_path,
+                         _measure_create_handler(_body),
+                         methods=["POST"],
+                         # keeps the operation ids the hand written endpoints had
+                         name="_" + _path.strip("/").replace("/", "_").replace("-", "_"),
+                         status_code=HTTPStatus.ACCEPTED,
+                         openapi_extra=_body.openapi)
+
+
+@router.delete("/measure/{measure_id}", status_code=HTTPStatus.ACCEPTED)
+async def _measure_remove(request: Request,
+                          measure_id: PositiveId,
+                          time: TimeArg = CommandBase.IMMEDIATE):
+    return _enqueue(request,
+                    _MEASURE_REMOVE_TMPL % (orjson.dumps(time), measure_id))
+
+
+@router.post("/measures/reset", status_code=HTTPStatus.ACCEPTED)
+async def _measures_clear(request: Request,
+                          time: TimeArg = CommandBase.IMMEDIATE):
+    return _enqueue(request, _command(CommandType.MEASURES_RESET, time))
+
+
+@router.post("/policy/{policy_id}", status_code=HTTPStatus.ACCEPTED)
+async def _policy_activate(request: Request,
+                           policy_id: PositiveId,
+                           time: TimeArg = CommandBase.IMMEDIATE):
+    return _enqueue(request,
+                    _POLICY_ACTIVATE_TMPL % (orjson.dumps(time), policy_id))
+
+
+@router.delete("/policy/{policy_id}", status_code=HTTPStatus.ACCEPTED)
+async def _policy_deactivate(request: Request,
+                             policy_id: PositiveId,
+                             time: TimeArg = CommandBase.IMMEDIATE):
+    return _enqueue(request,
+                    _POLICY_DEACTIVATE_TMPL % (orjson.dumps(time), policy_id))
+
+
+def build_app(conn: Connection | None = None) -> FastAPI:
+    """
+    The pipe can also be bound (or swapped) later through ``app.state.writer.conn``,
+    the tests share one app that way.
+    """
+    # logging is configured before the app is built and not touched afterwards,
+    # so the level check is done once here rather than on every request
+    writer = _CommandWriter(conn, debug=log.isEnabledFor(DEBUG))
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await writer.start()
+        try:
+            yield
+        finally:
+            await writer.stop()
+
+    app = FastAPI(title="tcon API",
+                  version="1.0.0",
+                  default_response_class=ORJSONResponse,
+                  exception_handlers={RequestValidationError: _validation_error},
+                  lifespan=lifespan)
+    app.state.writer = writer
+
+    def openapi() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            schema = FastAPI.openapi(app)
+            schema.setdefault("components", {}).setdefault("schemas", {}).update(_JsonBody.schemas())
+        return app.openapi_schema
+
+    app.openapi = openapi
+    app.include_router(router)
     return app
 
 
-def register_incidents(app: FastAPI, queue: mp.Queue) -> None:
-
-    @app.post("/incident", status_code=HTTPStatus.ACCEPTED)
-    def _incident_create(data: IncidentCreateInput):
-        if log.isEnabledFor(DEBUG):
-            log.debug(json.dumps(data.model_dump(), indent=2))
-        return _enqueue(queue,
-                        _as_command(data, IncidentCreateCmd))
-
-    @app.delete("/incident", status_code=HTTPStatus.ACCEPTED)
-    def _incident_remove(data: IncidentRemoveInput):
-        if log.isEnabledFor(DEBUG):
-            log.debug(json.dumps(data.model_dump(), indent=2))
-        return _enqueue(queue,
-                        _as_command(data, IncidentRemoveCmd))
-
-    @app.delete("/incidents/section/{section_id}", status_code=HTTPStatus.ACCEPTED)
-    def _incidents_clear_section(section_id: int = Path(..., gt=0),
-                                 time: float = Query(default=CommandBase.IMMEDIATE)):
-        cmd = IncidentsClearSectionCmd(time=time,
-                                       payload=IncidentsClearSectionDto(section_id=section_id))
-        return _enqueue(queue, cmd)
-
-    @app.post("/incidents/reset", status_code=HTTPStatus.ACCEPTED)
-    def _incidents_clear_all(time: float = Query(default=CommandBase.IMMEDIATE)):
-        cmd = IncidentsResetCmd(time=time)
-        return _enqueue(queue, cmd)
-
-
-def register_measures(app: FastAPI, queue: mp.Queue) -> None:
-    @app.post("/measure/speed", status_code=HTTPStatus.ACCEPTED)
-    def _measure_speed(data: MeasureSpeedSectionInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureSpeedSection))
-
-    @app.post("/measure/speed-detailed", status_code=HTTPStatus.ACCEPTED)
-    def _measure_speed_detailed(data: MeasureSpeedDetailedInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureSpeedDetailed))
-
-    @app.post("/measure/lane-closure", status_code=HTTPStatus.ACCEPTED)
-    def _measure_lane_closure(data: MeasureLaneClosureInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureLaneClosure))
-
-    @app.post("/measure/lane-closure-detailed", status_code=HTTPStatus.ACCEPTED)
-    def _measure_lane_closure_detailed(data: MeasureLaneClosureDetailedInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureLaneClosureDetailed))
-
-    @app.post("/measure/lane-unreserve", status_code=HTTPStatus.ACCEPTED)
-    def _measure_lane_unreserve(data: MeasureLaneDeactivateReservedInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureLaneDeactivateReserved))
-
-    @app.post("/measure/turn-close", status_code=HTTPStatus.ACCEPTED)
-    def _measure_turn_close(data: MeasureTurnCloseInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureTurnClose))
-
-    @app.post("/measure/turn-force/od", status_code=HTTPStatus.ACCEPTED)
-    def _measure_turn_force_od(data: MeasureTurnForceInputOd):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureTurnForceOD))
-
-    @app.post("/measure/turn-force/result", status_code=HTTPStatus.ACCEPTED)
-    def _measure_turn_force_result(data: MeasureTurnForceInputResult):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureTurnForceResult))
-
-    @app.post("/measure/destination-change", status_code=HTTPStatus.ACCEPTED)
-    def _measure_destination_change(data: MeasureDestinationChangeInput):
-        return _enqueue(queue,
-                        _as_measure_create_cmd(data, MeasureDestinationChange))
-
-    @app.delete("/measure/{measure_id}", status_code=HTTPStatus.ACCEPTED)
-    def _measure_remove(measure_id: int = Path(..., gt=0),
-                        time: float = Query(default=CommandBase.IMMEDIATE)):
-        cmd = MeasureRemoveCmd(time=time,
-                               payload=MeasureRemoveDto(id_action=measure_id))
-        return _enqueue(queue, cmd)
-
-    @app.post("/measures/reset", status_code=HTTPStatus.ACCEPTED)
-    def _measures_clear(time: float = Query(default=CommandBase.IMMEDIATE)):
-        cmd = MeasuresClearCmd(time=time)
-        return _enqueue(queue, cmd)
-
-
-def register_policies(app: FastAPI, queue: mp.Queue) -> None:
-    @app.post("/policy/{policy_id}", status_code=HTTPStatus.ACCEPTED)
-    def _policy_activate(policy_id: int = Path(..., gt=0),
-                         time: float = Query(default=CommandBase.IMMEDIATE)):
-        cmd = PolicyActivateCmd(time=time,
-                                payload=PolicyTargetDto(policy_id=policy_id))
-        return _enqueue(queue, cmd)
-
-    @app.delete("/policy/{policy_id}", status_code=HTTPStatus.ACCEPTED)
-    def _policy_deactivate(policy_id: int = Path(..., gt=0),
-                           time: float = Query(default=CommandBase.IMMEDIATE)):
-        cmd = PolicyDeactivateCmd(time=time,
-                                  payload=PolicyTargetDto(policy_id=policy_id))
-        return _enqueue(queue, cmd)
-
-
 # < FastAPI --------------------------------------------------------------------
 def _configure_log(cfg: dict) -> Logger:
     # Not shared accross process boundaries
@@ -210,21 +443,44 @@ def _configure_log(cfg: dict) -> Logger:
     logfile = cfg.get("logfile", mgr.default_logfile)
     ansi = cfg.get("ansi", mgr.default_logfile)
     mgr.configure_component(__name__, level, logfile, ansi)
+    # request handlers only enqueue their records, the writes happen on the
+    # listener's thread (this process only, the simulation keeps direct handlers)
+    mgr.start_listener()
+
+
+def _event_loop() -> str:
+    # uvloop has no Windows support (where Aimsun runs), so it is not part of the
+    # pinned requirements, use it only where it happens to be installed
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
 
 
 def run_api_process(
-        queue: mp.Queue,
+        conn: Connection,
         log_cfg: dict,
         host: str = "127.0.0.1",
         port: int = 6969) -> None:
     _configure_log(log_cfg)
     log.info("API listening on http://%s:%d", host, port)
-    app = build_app(queue)
+    app = build_app(conn)
+    # only needed here, the simulation process imports this module to spawn
+    # the server and should not pay for loading uvicorn
     import uvicorn
-    uvicorn.run(app,
-                host=host,
-                port=port,
-                log_level="warning")
+    try:
+        uvicorn.run(app,
+                    host=host,
+                    port=port,
+                    log_level="warning",
+                    loop=_event_loop(),
+                    http="httptools",
+                    # every response is the same 202, there is nothing worth logging
+                    access_log=False)
+    finally:
+        # multiprocessing children skip atexit, so the queue is flushed here
+        get_log_manager().stop_listener()
 
 
 def module_name() -> str:
@@ -233,4 +489,5 @@ def module_name() -> str:
 
 if __name__ == "__main__":
     log.setLevel("DEBUG")
-    run_api_process(mp.Queue())
+    _, conn = mp.Pipe(duplex=False)
+    run_api_process(conn, {})
@@ -2,8 +2,11 @@ from __future__ import annotations
 import multiprocessing as mp
 from types import TracebackType
 from typing import Iterator, Type
+import hashlib
+import os
 import shutil
 import pathlib
+import subprocess
 
 import re
 
@@ -11,11 +14,54 @@ import re
 from common.logger import get_logger, get_log_manager
 
 log = get_logger(__name__)
+_VER_RE = re.compile(r"(\d+)\.(\d+)")
 # ServerProcess > --------------------------------------------------------------
 
 if "_PYTHON_EXE" not in globals():
     _PYTHON_EXE: str | None = None
 
+# Probing the candidates spawns an interpreter for each of them, so the result is
+# remembered across sessions for as long as PATH (which decided it) and the
+# interpreter file itself (an in place upgrade changes its target, mtime or size) stay the same
+_PYTHON_EXE_CACHE_NAME = pathlib.Path(".cache") / "tcon" / "python_exe"
+
+
+def _python_exe_cache() -> pathlib.Path:
+    # Path.home() raises when there is no home to find, so only called where that is handled
+    return pathlib.Path.home() / _PYTHON_EXE_CACHE_NAME
+
+
+def _path_digest() -> str:
+    return hashlib.sha1(os.environ.get("PATH", "").encode()).hexdigest()
+
+
+def _exe_fingerprint(path: str) -> str:
+    real = os.path.realpath(path)
+    st = os.stat(real)
+    return f"{real}|{st.st_mtime_ns}|{st.st_size}"
+
+
+def _load_cached_python() -> str | None:
+    try:
+        digest, path, fingerprint = _python_exe_cache().read_text().splitlines()
+        if (digest != _path_digest()
+                or not pathlib.Path(path).is_file()
+                or fingerprint != _exe_fingerprint(path)):
+            return None
+    except (OSError, RuntimeError, KeyError, ValueError):
+        return None
+    log.debug("Using cached python location %s", path)
+    return path
+
+
+def _store_cached_python(path: str) -> None:
+    try:
+        cache = _python_exe_cache()
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(f"{_path_digest()}\n{path}\n{_exe_fingerprint(path)}\n")
+    except (OSError, RuntimeError, KeyError) as exc:
+        log.debug("Could not cache python location: %s", exc)
+
 
 class ServerProcess:
     def __init__(self,
@@ -25,8 +71,9 @@ class ServerProcess:
         self.host = host
         self.port = port
         self.executable = self._resolve_python_location(executable)
-        # IPC
-        self.queue: mp.Queue = mp.Queue()
+        # IPC, the API process only ever writes and we only ever read, commands
+        # travel as JSON encoded frames so neither side has to pickle anything
+        self._reader, self._writer = mp.Pipe(duplex=False)
         # Handle
         self._proc: mp.Process | None = None
 
@@ -43,7 +90,7 @@ class ServerProcess:
 
         self._proc = mp.Process(
             target=run_api_process,
-            args=(self.queue, api_log_cfg, self.host, self.port),
+            args=(self._writer, api_log_cfg, self.host, self.port),
             name="tcon-api")
         self._proc.start()
         log.info("API started on http://%s:%d (pid=%d)",
@@ -58,17 +105,16 @@ class ServerProcess:
         self._proc.close()
         self._proc = None
 
-        self.queue.close()
-        self.queue.join_thread()
-        self.queue = None
+        self._reader.close()
+        self._writer.close()
+        self._reader = None
+        self._writer = None
 
-    def try_recv_all(self) -> Iterator[object]:
-        """ Drain all pending messagess """
-        while True:
-            try:
-                yield self.queue.get_nowait()
-            except mp.queues.Empty:
-                break
+    def try_recv_all(self) -> Iterator[bytes]:
+        """ Drain all pending messages (JSON arrays of commands) """
+        reader = self._reader
+        while reader.poll():
+            yield reader.recv_bytes()
 
     @classmethod
     def _resolve_python_location(cls,
@@ -85,10 +131,13 @@ class ServerProcess:
             if not (p.exists() and p.is_file()):
                 log.debug("Microsoft store stub application???")
                 return None
-            import subprocess
             try:
-                out = subprocess.check_output([path, "-V"], text=True)
-                major, minor = map(int, re.search(r"(\d+)\.(\d+)", out).groups())
+                # -S skips site, we only care about the version
+                out = subprocess.check_output(
+                    [path, "-S", "-c", "import sys; print('%d.%d' % sys.version_info[:2])"],
+                    text=True)
+                m = _VER_RE.search(out)
+                major, minor = int(m[1]), int(m[2])
                 if (major, minor) == (3, 10):
                     return path
             except Exception as exc:
@@ -100,7 +149,12 @@ class ServerProcess:
         # of running server...
         _PYTHON_EXE = (
             configured  # we assume that the user supplied value is actually correct to speed up launch
-            or ok(shutil.which("python3.10"))
+            or _load_cached_python())
+        if _PYTHON_EXE is not None:
+            return _PYTHON_EXE
+
+        _PYTHON_EXE = (
+            ok(shutil.which("python3.10"))
             or ok(shutil.which("python3"))
             or ok(shutil.which("python")))
 
@@ -108,6 +162,7 @@ class ServerProcess:
             raise RuntimeError(
                 "Could not locate a Python 3.10 executable; "
                 "set 'python_location' in config.json, or add python executable to your PATH.")
+        _store_cached_python(_PYTHON_EXE)
         return _PYTHON_EXE
 
     def __enter__(self) -> "ServerProcess":
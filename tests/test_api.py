@@ -5,6 +5,7 @@ from common.models import (
     IncidentRemoveDto,
     IncidentsClearSectionDto,
 
+    CommandBatchRoot,
     CommandType,
 )
 from server.api import build_app
@@ -14,9 +15,9 @@ import sys
 import unittest
 import multiprocessing as mp
 import json
+import orjson
 
 from http import HTTPStatus
-from unittest.mock import patch
 from typing import ClassVar
 
 TEST_DIR = os.path.dirname(__file__)
@@ -28,44 +29,41 @@ if PROJECT_ROOT not in sys.path:
 class TestApi(unittest.TestCase):
     ACCEPTED_MSG: ClassVar[dict[str, bool]] = {"accepted": True}
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the app is stateless apart from the pipe it writes to, so it is built
+        # once and every test only binds a fresh pipe to its IPC writer
+        cls.app = build_app()
+        # entering the client runs the app lifespan, which starts the IPC writer task
+        cls.client = TestClient(cls.app)
+        cls.client.__enter__()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.__exit__(None, None, None)
+
     def setUp(self) -> None:
-        self.queue: mp.Queue = mp.Queue()
-        from pydantic import BaseModel
-
-        # Stub the Command union type defined in common.models, which isn't callable...
-        def _fake_command(*, command, time, payload):
-            if isinstance(payload, BaseModel):
-                payload_dict = payload.model_dump()
-            else:
-                payload_dict = payload
-            data = {"command": command, "time": time}
-            if payload_dict is not None:
-                data["payload"] = payload_dict
-
-            class _Obj:
-                def model_dump(self):
-                    return data
-            return _Obj()
-        import server.api
-        self._command_patch = patch.object(server.api, "Command", new=_fake_command)
-        self._command_patch.start()
-        self.app = build_app(self.queue)
-        self.client = TestClient(self.app)
+        self.reader, self.writer = mp.Pipe(duplex=False)
+        self.app.state.writer.conn = self.writer
 
     def tearDown(self) -> None:
-        if self.queue is not None:
-            self.queue.close()
-            self.queue.join_thread()
-            self.queue = None
-        self._command_patch.stop()
+        # nothing may still be on its way to this test's pipe
+        self.client.portal.call(self.app.state.writer.join)
+        self.reader.close()
+        self.writer.close()
+
+    def _drain_frames(self) -> list[bytes]:
+        """Raw batches exactly as the simulation receives them"""
+        self.client.portal.call(self.app.state.writer.join)
+        frames = []
+        while self.reader.poll():
+            frames.append(self.reader.recv_bytes())
+        return frames
 
     def _drain_queue(self):
         msgs = []
-        while True:
-            try:
-                msgs.append(self.queue.get_nowait())
-            except mp.queues.Empty:
-                break
+        for frame in self._drain_frames():
+            msgs.extend(orjson.loads(frame))
         return msgs
 
 
@@ -129,6 +127,21 @@ class TestApi(unittest.TestCase):
         msgs = self._drain_queue()
         self.assertEqual(msgs, [])
 
+    def test_incident_create_endpoint_ini_before_time(self):
+        """POST /incident scheduled after the incident's ini_time should return a 422 Unprocessable Entity."""
+        payload = {
+            "time": 10.0,
+            "section_id": 1,
+            "lane": 1,
+            "position": 0.0,
+            "length": 1.0,
+            "ini_time": 5.0,
+            "duration": 2.0,
+        }
+        resp = self.client.post("/incident", json=payload)
+        self.assertEqual(resp.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertEqual(self._drain_queue(), [])
+
     def test_incident_remove_endpoint(self):
         """DELETE /incident should return a message and queue a removal command."""
         section_id = 1
@@ -188,6 +201,19 @@ class TestApi(unittest.TestCase):
 
 # > Measures ------------------------------------------------------------------
 
+    def test_measure_remove_endpoint(self):
+        """DELETE /measure/{id}?time={value} should enqueue the removal of measure `id` at time of `value`"""
+        measure_id = 42
+        time = 600
+        resp = self.client.delete(f"/measure/{measure_id}?time={time}")
+        self.assertEqual(resp.status_code, HTTPStatus.ACCEPTED)
+        self.assertEqual(resp.json(), self.ACCEPTED_MSG)
+
+        cmd, = self._drain_queue()
+        self.assertEqual(cmd.get("command"), CommandType.MEASURE_REMOVE)
+        self.assertEqual(cmd.get("time"), time)
+        self.assertEqual(cmd["payload"]["id_action"], measure_id)
+
 
     def test_turn_force_od_valid(self):
         """POST /measure/turn-force/od enqueues a MEASURE_CREATE command."""
@@ -304,6 +330,8 @@ class TestApi(unittest.TestCase):
         self.assertEqual(cmd["time"], time)
 
         # Assert that we construct the new destinations list from the single destination
+        # and that the legacy field itself (exclude=True) stays off the wire
+        self.assertNotIn("new_destination", resp_payload)
         destination, = resp_payload["new_destinations"]
         self.assertEqual(destination["dest_id"], 222)
         self.assertEqual(destination["percentage"], 100.0)
@@ -377,3 +405,88 @@ class TestApi(unittest.TestCase):
         payload = cmd["payload"]
         self.assertEqual(payload["policy_id"], policy_id)
 # < Policies -------------------------------------------------------------------
+
+
+# > Wire format -----------------------------------------------------------------
+
+
+    def test_frames_validate_on_simulation_side(self):
+        """Every endpoint's frame must pass the ``CommandBatchRoot`` validation the simulation runs on receipt."""
+        requests = [
+            ("POST", "/incident", {"section_id": 1, "lane": 1, "position": 0.0,
+                                   "length": 1.0, "ini_time": 5.0, "duration": 2.0}),
+            ("DELETE", "/incident", {"section_id": 1, "lane": 1, "position": 0.0}),
+            ("DELETE", "/incidents/section/78?time=10", None),
+            ("POST", "/incidents/reset?time=10", None),
+            ("POST", "/measure/speed", {"time": 10, "section_ids": [1, 2], "speed": 50.0}),
+            ("POST", "/measure/speed-detailed", {"section_ids": [1], "speed": 50.0, "lane_id": 1}),
+            ("POST", "/measure/lane-closure", {"section_id": 1, "lane_id": 1}),
+            ("POST", "/measure/lane-closure-detailed", {"section_id": 1, "lane_id": 1, "apply_2LCF": True}),
+            ("POST", "/measure/lane-unreserve", {"section_id": 1, "lane_id": 1}),
+            ("POST", "/measure/turn-close", {"from_section_id": 1, "to_section_id": 2}),
+            ("POST", "/measure/turn-force/od", {"from_section_id": 1, "next_section_ids": [2]}),
+            ("POST", "/measure/turn-force/result", {"from_section_id": 1, "next_section_ids": [2],
+                                                    "old_next_section_id": 3}),
+            ("POST", "/measure/destination-change", {"section_id": 1, "new_destination": 2}),
+            ("DELETE", "/measure/42?time=10", None),
+            ("POST", "/measures/reset", None),
+            ("POST", "/policy/7?time=10", None),
+            ("DELETE", "/policy/7", None),
+        ]
+        for method, url, body in requests:
+            with self.subTest(method=method, url=url):
+                resp = self.client.request(method, url, json=body)
+                self.assertEqual(resp.status_code, HTTPStatus.ACCEPTED)
+                frames = self._drain_frames()
+                self.assertTrue(frames)
+                commands = [cmd for frame in frames
+                            for cmd in CommandBatchRoot.model_validate_json(frame).root]
+                self.assertEqual(len(commands), 1)
+
+    def test_non_json_content_type_rejected(self):
+        """Bodies not sent as JSON are refused, as FastAPI's own body handling would."""
+        body = b'{"section_ids": [1], "speed": 50.0}'
+        for content_type in ("text/plain", "application/x-www-form-urlencoded", "multipart/form-data"):
+            with self.subTest(content_type=content_type):
+                resp = self.client.post("/measure/speed", content=body,
+                                        headers={"Content-Type": content_type})
+                self.assertEqual(resp.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertEqual(self._drain_queue(), [])
+
+        resp = self.client.post("/measure/speed", content=body,
+                                headers={"Content-Type": "application/merge-patch+json; charset=utf-8"})
+        self.assertEqual(resp.status_code, HTTPStatus.ACCEPTED)
+        cmd, = self._drain_queue()
+        self.assertEqual(cmd["command"], CommandType.MEASURE_CREATE)
+
+    def test_openapi_lists_body_schemas(self):
+        """The body schemas generated on first request of /openapi.json are referenced by their endpoints."""
+        resp = self.client.get("/openapi.json")
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        doc = resp.json()
+        schemas = doc["components"]["schemas"]
+        for name in ("IncidentCreateInput", "MeasureDestinationChangeInput", "NewDestinations"):
+            self.assertIn(name, schemas)
+        body = doc["paths"]["/incident"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+        self.assertEqual(body, {"$ref": "#/components/schemas/IncidentCreateInput"})
+
+    def test_non_finite_time_rejected(self):
+        """nan/inf times would reach the simulation as null, so they must be refused with a 422."""
+        for value in ("nan", "inf", "-inf"):
+            with self.subTest(value=value):
+                resp = self.client.post(f"/measures/reset?time={value}")
+                self.assertEqual(resp.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+                resp = self.client.delete(f"/measure/42?time={value}")
+                self.assertEqual(resp.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+        for value in (b"NaN", b"Infinity", b"-Infinity"):
+            with self.subTest(value=value):
+                body = b'{"section_ids": [1], "speed": 50.0, "time": ' + value + b"}"
+                resp = self.client.post("/measure/speed", content=body,
+                                        headers={"Content-Type": "application/json"})
+                self.assertEqual(resp.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+                # the offending input itself is not valid JSON, it is reported as null
+                err, = resp.json()["detail"]
+                self.assertEqual(err["loc"], ["body", "time"])
+        self.assertEqual(self._drain_queue(), [])
+# < Wire format -----------------------------------------------------------------
@@ -1,15 +1,16 @@
-import json
 import os
 import sys
 import tempfile
 import unittest
 import pathlib
 from logging import DEBUG, INFO, WARNING, ERROR, CRITICAL
+from logging.handlers import QueueHandler
 
+import orjson
 from pydantic import ValidationError
 
-from common.config import load_config, AppConfig
-from common.logger import get_log_manager
+from common.config import _SCHEDULE_FILE_CACHE, load_config, AppConfig
+from common.logger import LogManager, get_log_manager
 from common.models import (
     Command,
     CommandType,
@@ -82,6 +83,26 @@ class TestConfigParsing(unittest.TestCase):
         expected = pathlib.Path(PROJECT_ROOT) / rel_logfile
         self.assertEqual(abs_path, expected)
 
+    def test_log_listener_flushes_on_stop(self):
+        """Records queued for the shared listener reach the logger's file and direct handlers return once it stops."""
+        # separate manager, the shared one must keep writing directly for the other tests
+        mgr = LogManager()
+        with tempfile.TemporaryDirectory() as tmp:
+            logfile = pathlib.Path(tmp) / "listener.log"
+            mgr.configure_component("tcon.tests.listener", logfile=str(logfile))
+            log = mgr.get_logger("tcon.tests.listener")
+            try:
+                mgr.start_listener()
+                self.assertTrue(all(isinstance(h, QueueHandler) for h in log.handlers))
+                log.warning("queued record")
+                mgr.stop_listener()
+                self.assertFalse(any(isinstance(h, QueueHandler) for h in log.handlers))
+                self.assertIn("queued record", logfile.read_text(encoding="utf-8"))
+            finally:
+                mgr.stop_listener()
+                for handler in log.handlers:
+                    handler.close()
+
     def test_valid_schedule(self):
         """Valid schedules should be parsed into Schedule instances of correct length."""
         cfg_dict = {
@@ -184,6 +205,46 @@ class TestConfigParsing(unittest.TestCase):
         times = [sc.time for sc in sch.ready(set_all_ready_time)]
         assert times == sorted(times) == [50, 150, 300]
 
+    def test_schedule_file_reloads_on_change(self):
+        """Unchanged schedule files are served from cache, edited ones are parsed again"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "schedule.json"
+            entry = {"command": "incidents_reset", "time": 10}
+            path.write_bytes(orjson.dumps([entry]))
+
+            first = AppConfig.from_dict({"schedule_file": str(path)})
+            again = AppConfig.from_dict({"schedule_file": str(path)})
+            self.assertEqual(list(first.schedule), list(again.schedule))
+
+            path.write_bytes(orjson.dumps([entry, dict(entry, time=20)]))
+            edited = AppConfig.from_dict({"schedule_file": str(path)})
+            self.assertEqual(len(edited.schedule), 2)
+            # the edit replaced the cached entry instead of adding another one
+            self.assertEqual(len(_SCHEDULE_FILE_CACHE[str(path)][1]), 2)
+
+    def test_unreadable_schedule_file(self):
+        """A schedule file that cannot be read is reported as such, not as a validation error"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "missing.json"
+            with self.assertLogs("common.config", level=ERROR) as logs:
+                cfg = AppConfig.from_dict({"schedule_file": str(path)})
+        self.assertEqual(len(cfg.schedule), 0)
+        self.assertTrue(any("could not read schedule file" in line for line in logs.output))
+
+    def test_from_json_bytes(self):
+        """In-memory JSON documents should parse the same as files"""
+        blob = orjson.dumps({
+            "api": {"port": 7070},
+            "schedule": [{"command": "incidents_reset", "time": 5}],
+        })
+        cfg = AppConfig.from_json_bytes(blob)
+        self.assertEqual(cfg.api_host, AppConfig.DEFAULT_HOST)
+        self.assertEqual(cfg.api_port, 7070)
+        self.assertEqual(len(cfg.schedule), 1)
+
+        with self.assertRaises(ValueError):
+            AppConfig.from_json_bytes(b"{not json")
+
     def test_load_config_from_missing_file(self):
         path = pathlib.Path(tempfile.gettempdir()) / "test-config-no-exist.json"
         if path.exists():
@@ -195,7 +256,7 @@ class TestConfigParsing(unittest.TestCase):
 
     def test_load_config_valid_file(self):
         """Loading from a valid JSON file should parse correctly."""
-        tmp = tempfile.NamedTemporaryFile("w", delete=False)
+        fd, tmp_name = tempfile.mkstemp(suffix=".json")
         cfg_dict = {
             "api": {
                 "host": "123.123.123.123",
@@ -267,12 +328,12 @@ class TestConfigParsing(unittest.TestCase):
                 }
             ]
         }
-        json.dump(cfg_dict, tmp)
-        tmp.close()
+        os.write(fd, orjson.dumps(cfg_dict))
+        os.close(fd)
         try:
-            cfg = load_config(pathlib.Path(tmp.name))
+            cfg = load_config(pathlib.Path(tmp_name))
             self.assertEqual(cfg.api_host, "123.123.123.123")
             self.assertEqual(cfg.api_port, 6969)
             self.assertEqual(len(cfg.schedule), 4)
         finally:
-            os.unlink(tmp.name)
+            os.unlink(tmp_name)
@@ -0,0 +1,57 @@
+"""Tests for the IPC batch handling in ``aimsun_entrypoint`` (against the fake AAPI module)."""
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+
+def _policy(policy_id: int, time: float = -1) -> dict:
+    return {"command": "policy_activate", "time": time, "payload": {"policy_id": policy_id}}
+
+
+class TestEntrypointIpc(unittest.TestCase):
+    def setUp(self) -> None:
+        # imported here rather than at collection time, the entrypoint re-executes
+        # the modules it depends on when first loaded
+        import aimsun_entrypoint as ep
+        ep._imports()
+        self.ep = ep
+        self.log = MagicMock()
+        self.executed = []
+        for name, value in (("log", self.log),
+                            ("_SCHEDULE", ep.Schedule()),
+                            ("_execute", self.executed.append)):
+            patcher = patch.object(ep, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _receive(self, *batches: bytes, current_time: float = 10.0) -> None:
+        server = types.SimpleNamespace(try_recv_all=lambda: list(batches))
+        with patch.object(self.ep, "_SERVER", server, create=True):
+            self.ep._process_ipc(current_time=current_time)
+
+    def test_valid_batch(self):
+        """Due commands are executed right away, future ones end up in the schedule."""
+        self._receive(orjson.dumps([_policy(1), _policy(2, time=50.0)]))
+
+        executed, = self.executed
+        self.assertEqual(executed.payload.policy_id, 1)
+        scheduled, = self.ep._SCHEDULE
+        self.assertEqual(scheduled.payload.policy_id, 2)
+        self.log.error.assert_not_called()
+
+    def test_mixed_batch_drops_only_invalid(self):
+        """One invalid command is rejected and logged, the rest of its batch still goes through."""
+        self._receive(orjson.dumps([_policy(1), _policy(0), _policy(3)]))
+
+        self.assertEqual([cmd.payload.policy_id for cmd in self.executed], [1, 3])
+        self.log.error.assert_called_once()
+
+    def test_non_json_batch(self):
+        """Garbage on the pipe is logged and skipped without affecting the following batches."""
+        self._receive(b"\xffnot json", orjson.dumps([_policy(1)]))
+
+        executed, = self.executed
+        self.assertEqual(executed.payload.policy_id, 1)
+        self.log.exception.assert_called_once()
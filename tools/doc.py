@@ -3,19 +3,33 @@ from __future__ import annotations
 from common.models import Command
 from common.constants import get_project_root
 from pydantic import BaseModel, TypeAdapter
+from json_schema_for_humans.generate import generate_from_filename
+from json_schema_for_humans.generation_configuration import GenerationConfiguration
 
-import json
-import sys
+import multiprocessing as mp
+import orjson
+import os
+import shutil
 import subprocess
+import sys
 import webbrowser
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Annotated,
+    Iterable,
     Union,
     get_args,
     get_origin)
 
+# shared by every render() call, the options don't change between schemas.
+# All pages go to the same directory and share the template's CSS/JS, so those are
+# copied by the first render only, the others must not write the same files again
+GENERATION_CONFIG = GenerationConfiguration(minify=True)
+_NO_ASSETS_CONFIG = GenerationConfiguration(minify=True, copy_css=False, copy_js=False)
+
 # with this we don't have to manually import every single *Cmd type, we can just
 # walk the Command type definition and retrieve the types that comprise it.
 # Annotated[Union[...]], Field(discriminator="command")
@@ -30,6 +44,50 @@ def unwrap_union(tp):
     return (tp,)
 
 
+CMD_TYPES: tuple[type[BaseModel], ...] = tuple(
+    t for t in unwrap_union(Command) if isinstance(t, type) and issubclass(t, BaseModel))
+
+
+# built lazily rather than as a module constant, the render pool workers import this
+# module too and have no use for it
+@lru_cache(maxsize=None)
+def _command_adapter() -> TypeAdapter:
+    return TypeAdapter(Command)
+
+
+def _referenced_defs(schema, defs: dict) -> dict:
+    """Collect the $defs entries the schema refers to, transitively, so each
+    per-class schema file stays self contained."""
+    found: dict = {}
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                name = ref[len("#/$defs/"):]
+                if name not in found and name in defs:
+                    found[name] = defs[name]
+                    stack.append(defs[name])
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return found
+
+
+def _write_json(path: Path, obj) -> bool:
+    """Write obj as JSON, unless the file already holds exactly these bytes.
+    Returns whether the file was (re)written."""
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
 def make_out_dir(arg_path: str) -> Path:
     p = Path(arg_path)
     if not p.is_absolute():
@@ -38,12 +96,62 @@ def make_out_dir(arg_path: str) -> Path:
     return p.resolve()
 
 
-def render(json_in: Path,
-           html_out: Path) -> None:
-    try:
-        subprocess.run(["generate-schema-doc", str(json_in), str(html_out)], check=False)
-    except Exception as exc:
-        print(f"{exc}", file=sys.stderr)
+def _render_pair(pair: tuple[Path, Path], copy_assets: bool = False) -> None:
+    json_in, html_out = pair
+    config = GENERATION_CONFIG if copy_assets else _NO_ASSETS_CONFIG
+    generate_from_filename(str(json_in), str(html_out), config=config)
+
+
+def render(pairs: Iterable[tuple[Path, Path]]) -> None:
+    """Render every (json_in, html_out) pair, the first one in this process (it also
+    copies the shared CSS/JS assets), the rest spread over a process pool where
+    workers can be forked (template rendering is CPU bound). Spawned workers would
+    each re-import pydantic and our models, costing more than the ~10 renders they
+    would take over, so without fork (Windows) they are rendered here one by one.
+    Raises RuntimeError listing every schema that failed to render."""
+    pairs = list(pairs)
+    failures: list[str] = []
+
+    def _failed(pair: tuple[Path, Path], exc: BaseException) -> None:
+        # drop the stale page so the next run doesn't skip this schema as up to date
+        pair[1].unlink(missing_ok=True)
+        failures.append(f"{pair[0].name}: {exc}")
+
+    def _render_here(pair: tuple[Path, Path], copy_assets: bool = False) -> None:
+        try:
+            _render_pair(pair, copy_assets)
+        except Exception as exc:
+            _failed(pair, exc)
+
+    if pairs:
+        _render_here(pairs[0], copy_assets=True)
+    rest = pairs[1:]
+    workers = min(len(rest), os.cpu_count() or 1)
+    if workers <= 1 or "fork" not in mp.get_all_start_methods():
+        for pair in rest:
+            _render_here(pair)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("fork")) as pool:
+            futures = {pool.submit(_render_pair, pair): pair for pair in rest}
+            for future in as_completed(futures):
+                exc = future.exception()
+                if exc is not None:
+                    _failed(futures[future], exc)
+    if failures:
+        raise RuntimeError("Failed to render:\n  " + "\n  ".join(failures))
+
+
+def _open_in_browser(html: Path) -> None:
+    # webbrowser probes the desktop for registered browsers (blocking) before opening,
+    # on Linux hand the file straight to xdg-open and don't wait for it
+    xdg_open = shutil.which("xdg-open") if sys.platform.startswith("linux") else None
+    if xdg_open is None:
+        webbrowser.open_new_tab(html.as_uri())
+        return
+    subprocess.Popen([xdg_open, str(html)],
+                     start_new_session=True,
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL)
 
 
 def main() -> int:
@@ -54,27 +162,42 @@ def main() -> int:
                     help="Output dir for HTML docs")
     ap.add_argument("-o", "--open", action="store_true",
                     help="Open the generated HTML")
+    ap.add_argument("-f", "--force", action="store_true",
+                    help="Re-render HTML even for schemas that did not change")
     args = ap.parse_args()
 
     out_schema_dir = make_out_dir(args.out_schemas)
     out_html_dir = make_out_dir(args.out_html)
 
-    out_schema_dir.mkdir(parents=True, exist_ok=True)
-    out_html_dir.mkdir(parents=True, exist_ok=True)
-
-    union_schema = TypeAdapter(Command).json_schema()
-    cmd_schema_path = out_schema_dir / "Command.schema.json"
-    cmd_schema_path.write_text(json.dumps(union_schema, indent=2, ensure_ascii=False), encoding="utf-8")
+    # unchanged schemas with existing HTML are skipped, rendering dominates the runtime
+    to_render: list[tuple[Path, Path]] = []
 
-    cmd_types = [t for t in unwrap_union(Command) if isinstance(t, type) and issubclass(t, BaseModel)]
-    for cls in cmd_types:
-        path = out_schema_dir / f"{cls.__name__}.schema.json"
-        path.write_text(json.dumps(cls.model_json_schema(), indent=2, ensure_ascii=False), encoding="utf-8")
+    def _stale(schema_path: Path, html_path: Path, changed: bool) -> None:
+        if changed or args.force or not html_path.exists():
+            to_render.append((schema_path, html_path))
 
+    union_schema = _command_adapter().json_schema()
+    cmd_schema_path = out_schema_dir / "Command.schema.json"
     command_html = out_html_dir / "Command.html"
-    render(cmd_schema_path, command_html)
-    for cls in cmd_types:
-        render(out_schema_dir / f"{cls.__name__}.schema.json", out_html_dir / f"{cls.__name__}.html")
+    _stale(cmd_schema_path, command_html, _write_json(cmd_schema_path, union_schema))
+
+    # the union schema already carries every variant (and what they share) in its $defs,
+    # slice the per-class schemas out of it instead of generating them again
+    cmd_paths = [(cls, out_schema_dir / f"{cls.__name__}.schema.json", out_html_dir / f"{cls.__name__}.html")
+                 for cls in CMD_TYPES]
+    defs = union_schema.get("$defs", {})
+    for cls, schema_path, html_path in cmd_paths:
+        schema = dict(defs[cls.__name__])
+        sub_defs = _referenced_defs(schema, defs)
+        if sub_defs:
+            schema["$defs"] = sub_defs
+        _stale(schema_path, html_path, _write_json(schema_path, schema))
+
+    try:
+        render(to_render)
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
 
     print(f"Wrote JSON Schemas to: {out_schema_dir}")
     print(f"Wrote HTML docs to   : {out_html_dir}")
@@ -82,7 +205,7 @@ def main() -> int:
     if args.open and command_html.exists():
         print("Opening docs")
         try:
-            webbrowser.open_new_tab(command_html.as_uri())
+            _open_in_browser(command_html)
             print(f"Opened {command_html}")
         except Exception as e:
             print(f"Could not open browser automatically: {e}")